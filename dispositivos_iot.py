@@ -4,9 +4,36 @@
 # ============================================================
 
 from __future__ import annotations  # Para anotaciones de tipos hacia adelante
+import asyncio
 import random
+import sys
 import time
-from typing import List
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+# Generador propio de la simulación, independiente del 'random' global: se
+# siembra con sembrar(), no con random.seed().
+_rng = random.Random()
+# Alias a nivel de módulo: evita buscar 'randint' en el generador en cada lectura.
+_randint = _rng.randint
+
+
+def sembrar(semilla: int) -> None:
+    """
+    Fija la semilla de las lecturas simuladas para obtener corridas reproducibles.
+    Puede llamarse en cualquier momento, antes o después de crear los sensores.
+    (random.seed() no afecta a las lecturas: usan un generador propio.)
+    """
+    _rng.seed(semilla)
+
+
+def _emitir(linea: str, buf: Optional[List[str]]) -> None:
+    """Imprime 'linea' o, si se recibe un buffer, la acumula para escribirla después."""
+    if buf is None:
+        print(linea)
+    else:
+        buf.append(linea)
+
 
 # ------------------------------------------------------------
 # Clase base: DispositivoIoT
@@ -19,17 +46,34 @@ class DispositivoIoT:
     Atributos privados:
         __id_dispositivo (str): Identificador único legible para el usuario.
         __estado (bool): True si el dispositivo está encendido, False si está apagado.
+        __encabezado (str): Comienzo de la línea de 'mostrar_datos()' (clase e ID);
+            se arma una sola vez y en cada llamada solo se agrega el estado.
 
     Encapsulamiento:
         - Ambos atributos son privados (doble guión bajo __).
         - Se exponen a través de propiedades de solo lectura o métodos específicos.
+
+    Memoria:
+        - Se declaran __slots__ (aquí y en cada subclase): los objetos no llevan
+          un __dict__ propio.
+        - El encabezado en caché sí suma una cadena por dispositivo: se cambia
+          algo de memoria por no formatear esa línea en cada ciclo.
     """
 
+    # Python aplica el name mangling también aquí (__estado -> _DispositivoIoT__estado)
+    __slots__ = ("__id_dispositivo", "__estado", "__encabezado")
+
+    # Plantillas de los mensajes de encendido/apagado (se completan con el ID)
+    _MSG_ENCENDIDO = "[INFO] %s encendido."
+    _MSG_APAGADO = "[INFO] %s apagado."
+
     def __init__(self, id_dispositivo: str) -> None:
         # Guardamos el ID en un atributo privado para evitar accesos directos externos
         self.__id_dispositivo: str = id_dispositivo
         # Por diseño, todo dispositivo inicia apagado para evitar acciones no controladas
         self.__estado: bool = False
+        # type(self) es la subclase concreta, así el encabezado muestra su nombre
+        self.__encabezado: str = f"[{type(self).__name__}] ID: {id_dispositivo} | Estado: "
 
     # ---------- Propiedades (getters) ----------
     @property
@@ -47,21 +91,22 @@ class DispositivoIoT:
     def encender(self) -> None:
         """Cambia el estado interno a encendido."""
         self.__estado = True
-        print(f"[INFO] {self.__id_dispositivo} encendido.")
+        print(self._MSG_ENCENDIDO % self.__id_dispositivo)
 
     def apagar(self) -> None:
         """Cambia el estado interno a apagado."""
         self.__estado = False
-        print(f"[INFO] {self.__id_dispositivo} apagado.")
+        print(self._MSG_APAGADO % self.__id_dispositivo)
 
     # ---------- Método polimórfico ----------
-    def mostrar_datos(self) -> None:
+    def mostrar_datos(self, buf: Optional[List[str]] = None) -> None:
         """
         Muestra información común del dispositivo.
         Este método será extendido (sobrescrito) por las subclases.
+        Si se pasa 'buf', las líneas se agregan a esa lista en lugar de imprimirse,
+        para que quien llama las escriba todas juntas.
         """
-        estado_str = "Encendido" if self.__estado else "Apagado"
-        print(f"[{self.__class__.__name__}] ID: {self.__id_dispositivo} | Estado: {estado_str}")
+        _emitir(self.__encabezado + ("Encendido" if self.__estado else "Apagado"), buf)
 
 
 # ------------------------------------------------------------
@@ -79,6 +124,8 @@ class SensorTemperatura(DispositivoIoT):
         - La actualización ocurre exclusivamente mediante 'leer_temperatura()'.
     """
 
+    __slots__ = ("__temperatura",)
+
     def __init__(self, id_dispositivo: str) -> None:
         super().__init__(id_dispositivo)
         self.__temperatura: float = 0.0  # Valor inicial “neutro”
@@ -90,21 +137,35 @@ class SensorTemperatura(DispositivoIoT):
         - Si está apagado, el valor vuelve a 0.0 para indicar inactividad.
         """
         if self.estado:
-            # random.uniform genera valores flotantes; redondeamos a 2 decimales
-            self.__temperatura = round(random.uniform(20.0, 40.0), 2)
+            # Sorteamos centésimas de grado (2000 a 4000) y escalamos: ya quedan 2 decimales
+            # sin pasar por random.uniform + round
+            self.__temperatura = _randint(2000, 4000) / 100
         else:
             self.__temperatura = 0.0
         return self.__temperatura
 
+    async def leer_temperatura_async(self, executor: Optional[Executor] = None) -> float:
+        """
+        Versión asíncrona de 'leer_temperatura()' para usar con asyncio.gather.
+        - Sin 'executor', lee directamente: la lectura simulada solo sortea un
+          número y pasarla a otro hilo costaría más que hacerla.
+        - Con 'executor' (p.ej., un pool para sensores con E/S real), la lectura
+          corre allí sin bloquear el bucle de eventos.
+        """
+        if executor is None:
+            return self.leer_temperatura()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.leer_temperatura)
+
     @property
     def temperatura(self) -> float:
         """Devuelve la última temperatura leída (°C)."""
         return self.__temperatura
 
     # Polimorfismo: sobrescribimos mostrar_datos para agregar la temperatura
-    def mostrar_datos(self) -> None:
-        super().mostrar_datos()  # Muestra ID y estado desde la clase base
-        print(f"   • Temperatura actual: {self.__temperatura} °C\n")
+    def mostrar_datos(self, buf: Optional[List[str]] = None) -> None:
+        super().mostrar_datos(buf)  # Muestra ID y estado desde la clase base
+        _emitir(f"   • Temperatura actual: {self.__temperatura} °C\n", buf)
 
 
 # ------------------------------------------------------------
@@ -122,6 +183,8 @@ class SensorHumedad(DispositivoIoT):
         - La actualización ocurre mediante 'leer_humedad()'.
     """
 
+    __slots__ = ("__humedad",)
+
     def __init__(self, id_dispositivo: str) -> None:
         super().__init__(id_dispositivo)
         self.__humedad: float = 0.0
@@ -133,20 +196,27 @@ class SensorHumedad(DispositivoIoT):
         - Si está apagado, reinicia a 0.0.
         """
         if self.estado:
-            self.__humedad = round(random.uniform(30.0, 90.0), 2)
+            self.__humedad = _randint(3000, 9000) / 100
         else:
             self.__humedad = 0.0
         return self.__humedad
 
+    async def leer_humedad_async(self, executor: Optional[Executor] = None) -> float:
+        """Versión asíncrona de 'leer_humedad()'; usa 'executor' si se indica."""
+        if executor is None:
+            return self.leer_humedad()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.leer_humedad)
+
     @property
     def humedad(self) -> float:
         """Devuelve la última humedad leída (%)."""
         return self.__humedad
 
     # Polimorfismo: sobrescribimos mostrar_datos para agregar la humedad
-    def mostrar_datos(self) -> None:
-        super().mostrar_datos()
-        print(f"   • Humedad actual: {self.__humedad} %\n")
+    def mostrar_datos(self, buf: Optional[List[str]] = None) -> None:
+        super().mostrar_datos(buf)
+        _emitir(f"   • Humedad actual: {self.__humedad} %\n", buf)
 
 
 # ------------------------------------------------------------
@@ -162,8 +232,15 @@ class ActuadorLuz(DispositivoIoT):
     Encapsulamiento:
         - Propiedad de lectura 'intensidad'.
         - Método 'ajustar_intensidad(valor)' controla validaciones y cambios.
+        - Método 'ajustar_intensidad_rapida(valor)' para bucles de simulación:
+          respeta el estado y recorta a 0-100, pero no valida el tipo ni imprime.
     """
 
+    __slots__ = ("__intensidad",)
+
+    # Aviso cuando se intenta ajustar una luz apagada (se completa con el ID)
+    _MSG_APAGADO_AJUSTE = "[ADVERTENCIA] %s está apagado; no se puede ajustar intensidad."
+
     def __init__(self, id_dispositivo: str) -> None:
         super().__init__(id_dispositivo)
         self.__intensidad: int = 0  # Arranca en 0% para seguridad
@@ -176,7 +253,7 @@ class ActuadorLuz(DispositivoIoT):
             - Si está apagado, no se modifica (se informa por consola).
         """
         if not self.estado:
-            print(f"[ADVERTENCIA] {self.id_dispositivo} está apagado; no se puede ajustar intensidad.")
+            print(self._MSG_APAGADO_AJUSTE % self.id_dispositivo)
             return
 
         if not isinstance(valor, int):
@@ -189,24 +266,126 @@ class ActuadorLuz(DispositivoIoT):
         else:
             print("[ERROR] Valor fuera de rango (0-100). No se aplica cambio.")
 
+    def ajustar_intensidad_rapida(self, valor: int) -> bool:
+        """
+        Variante liviana de 'ajustar_intensidad()' para bucles de simulación.
+        - Si está apagado, no se modifica y devuelve False.
+        - No comprueba el tipo ni informa por consola: quien llama garantiza que
+          'valor' es un entero y decide qué mostrar.
+        - Recorta el valor al rango 0-100 y devuelve True.
+        """
+        if not self.estado:
+            return False
+        self.__intensidad = 0 if valor < 0 else 100 if valor > 100 else valor
+        return True
+
     @property
     def intensidad(self) -> int:
         """Devuelve la intensidad actual del actuador (%)."""
         return self.__intensidad
 
     # Polimorfismo: sobrescribimos mostrar_datos para agregar la intensidad
-    def mostrar_datos(self) -> None:
-        super().mostrar_datos()
-        print(f"   • Intensidad actual: {self.__intensidad} %\n")
+    def mostrar_datos(self, buf: Optional[List[str]] = None) -> None:
+        super().mostrar_datos(buf)
+        _emitir(f"   • Intensidad actual: {self.__intensidad} %\n", buf)
 
 
 # ------------------------------------------------------------
 # Función de simulación de monitoreo
 # ------------------------------------------------------------
-def simulacion_monitoreo(dispositivos: List[DispositivoIoT],
-                         ciclos: int = 5,
-                         pausa_seg: float = 1.5,
-                         umbral_temp: float = 30.0) -> None:
+# Intensidad de las luces según haya o no alarma de calor (índice: False=0, True=1).
+# Son valores fijos y válidos, por eso se aplican sin pasar por las validaciones.
+_INTENSIDAD_POR_ALARMA = (20, 80)
+
+
+def _separar_por_tipo(dispositivos: List[DispositivoIoT]
+                      ) -> Tuple[List[SensorTemperatura], List[SensorHumedad], List[ActuadorLuz]]:
+    """
+    Separa 'dispositivos' en (sensores de temperatura, de humedad, actuadores).
+    Es el único lugar donde se distingue el tipo de cada dispositivo.
+    """
+    sensores_temp = [d for d in dispositivos if isinstance(d, SensorTemperatura)]
+    sensores_hum = [d for d in dispositivos if isinstance(d, SensorHumedad)]
+    actuadores = [d for d in dispositivos if isinstance(d, ActuadorLuz)]
+    return sensores_temp, sensores_hum, actuadores
+
+
+def crear_ciclo_monitoreo(dispositivos: List[DispositivoIoT],
+                          umbral_temp: float = 30.0,
+                          executor: Optional[Executor] = None
+                          ) -> Callable[[int], Awaitable[None]]:
+    """
+    Prepara y devuelve la corrutina que ejecuta UN ciclo de monitoreo sobre
+    'dispositivos' (ver simulacion_monitoreo para las reglas).
+
+    La lista de dispositivos no cambia durante la simulación, así que todo lo
+    que depende de ella se resuelve aquí una sola vez: la separación por tipo
+    (sin repetir los isinstance en cada ciclo) y los métodos ya enlazados de
+    cada dispositivo. La función devuelta solo recorre esas listas fijas.
+
+    Sin 'executor', las lecturas se hacen directamente y en orden fijo, de modo
+    que una simulación sembrada es reproducible. Con 'executor', se reparten en
+    él y se esperan con asyncio.gather; el orden de los sorteos depende
+    entonces del planificador de hilos.
+    La función devuelta recibe el número de ciclo, usado en el encabezado.
+    """
+    sensores_temp, sensores_hum, actuadores = _separar_por_tipo(dispositivos)
+
+    if executor is None:
+        lectores_temp = [s.leer_temperatura for s in sensores_temp]
+        lectores_hum = [s.leer_humedad for s in sensores_hum]
+    else:
+        lectores_temp = [s.leer_temperatura_async for s in sensores_temp]
+        lectores_hum = [s.leer_humedad_async for s in sensores_hum]
+    ajustes = [(a.id_dispositivo, a.ajustar_intensidad_rapida) for a in actuadores]
+    mostradores = [d.mostrar_datos for d in dispositivos]
+
+    async def ciclo(numero: int) -> None:
+        # Acumulamos la salida del ciclo y la escribimos de una sola vez al final
+        buf: List[str] = [f"------------------- Ciclo {numero} -------------------"]
+
+        # 1) ACTUALIZACIÓN DE SENSORES
+        # Los actuadores no “leen” valores externos aquí.
+        # Nos quedamos con las temperaturas leídas para decidir la alarma.
+        if executor is None:
+            temperaturas = [leer() for leer in lectores_temp]
+            for leer in lectores_hum:
+                leer()
+        else:
+            # Lanzamos todas las lecturas a la vez; gather las devuelve en orden
+            temperaturas, _ = await asyncio.gather(
+                asyncio.gather(*(leer(executor) for leer in lectores_temp)),
+                asyncio.gather(*(leer(executor) for leer in lectores_hum)),
+            )
+
+        # 2) REGLAS DE ACTUACIÓN (lógica simple basada en temperatura)
+        # Basta con comparar la máxima temperatura leída contra el umbral
+        alarma_calor = max(temperaturas, default=float("-inf")) > umbral_temp
+
+        # Según la condición, ajustamos todos los actuadores de luz encendidos
+        objetivo = _INTENSIDAD_POR_ALARMA[alarma_calor]
+        ajustados: List[str] = []
+        for id_actuador, ajustar in ajustes:
+            if ajustar(objetivo):
+                ajustados.append(id_actuador)
+            else:
+                buf.append(ActuadorLuz._MSG_APAGADO_AJUSTE % id_actuador)
+        if ajustados:
+            buf.append(f"[INFO] Intensidad de {', '.join(ajustados)} ajustada a {objetivo}%")
+
+        # 3) POLIMORFISMO: cada objeto muestra lo que le corresponde
+        for mostrar in mostradores:
+            mostrar(buf)
+        sys.stdout.write("\n".join(buf) + "\n")
+
+    return ciclo
+
+
+async def simulacion_monitoreo(dispositivos: List[DispositivoIoT],
+                               ciclos: int = 5,
+                               pausa_seg: float = 1.5,
+                               umbral_temp: float = 30.0,
+                               executor: Optional[Executor] = None) -> None:
     """
     Ejecuta un ciclo de monitoreo donde:
       1) Los sensores leen valores nuevos (si están encendidos).
@@ -215,39 +394,36 @@ def simulacion_monitoreo(dispositivos: List[DispositivoIoT],
            - En caso contrario -> luces al 20%.
       3) Se demuestra polimorfismo invocando mostrar_datos() para cada objeto.
 
+    Es una corrutina: la pausa entre ciclos no bloquea el bucle de eventos.
+    Las lecturas simuladas se hacen directamente, en orden fijo. Si los
+    sensores hacen E/S real, se puede pasar un 'executor' (p.ej., un
+    ThreadPoolExecutor creado una sola vez por quien llama) para repartirlas
+    allí. Los ajustes de las luces solo guardan un valor, así que se aplican
+    directamente y se informan en una sola línea.
+
+    Cada ciclo arranca 'pausa_seg' segundos después del anterior: la pausa solo
+    cubre el tiempo que sobra tras el trabajo del ciclo, así no se acumula deriva.
     """
     print("\n================ INICIO DE MONITOREO ================\n")
 
-    for ciclo in range(1, ciclos + 1):
-        print(f"------------------- Ciclo {ciclo} -------------------")
-
-        # 1) ACTUALIZACIÓN DE SENSORES
-        # Recorremos la lista y, mediante isinstance, invocamos su lectura correspondiente
-        # (esto mantiene el código claro y explícito para el evaluador).
-        for d in dispositivos:
-            if isinstance(d, SensorTemperatura):
-                d.leer_temperatura()
-            elif isinstance(d, SensorHumedad):
-                d.leer_humedad()
-            # Si es un actuador, no “lee” valores externos aquí.
-
-        # 2) REGLAS DE ACTUACIÓN (lógica simple basada en temperatura)
-        # Identificamos temperaturas presentes para decidir la intensidad de las luces.
-        temperaturas = [d.temperatura for d in dispositivos if isinstance(d, SensorTemperatura)]
-        # Comprobamos si hay alguna temperatura por encima del umbral
-        alarma_calor = any(t > umbral_temp for t in temperaturas)
-
-        # Según la condición, ajustamos todos los actuadores de luz presentes
-        for d in dispositivos:
-            if isinstance(d, ActuadorLuz):
-                d.ajustar_intensidad(80 if alarma_calor else 20)
+    # El ciclo se prepara una sola vez para esta composición de dispositivos
+    ejecutar_ciclo = crear_ciclo_monitoreo(dispositivos, umbral_temp, executor)
 
-        # 3) POLIMORFISMO: cada objeto muestra lo que le corresponde
-        for d in dispositivos:
-            d.mostrar_datos()
-
-        # Pausa para simular el tiempo entre lecturas (p.ej., 1.5 segundos)
-        time.sleep(pausa_seg)
+    proximo_tick = time.perf_counter()
+    for ciclo in range(1, ciclos + 1):
+        await ejecutar_ciclo(ciclo)
+
+        # Pausa para simular el tiempo entre lecturas (p.ej., 1.5 segundos),
+        # descontando lo que ya tardó el ciclo
+        proximo_tick += pausa_seg
+        holgura = proximo_tick - time.perf_counter()
+        # Con holgura exactamente 0 el ciclo llegó justo a tiempo: no hay que esperar
+        if holgura > 0:
+            await asyncio.sleep(holgura)
+        elif holgura < 0 and pausa_seg > 0:
+            print(f"[ADVERTENCIA] El ciclo {ciclo} se excedió en {-holgura * 1000:.1f} ms.")
+            # Reprogramamos desde ahora para no encadenar ciclos intentando recuperar
+            proximo_tick = time.perf_counter()
 
     print("================= FIN DE MONITOREO =================\n")
 
@@ -255,8 +431,8 @@ def simulacion_monitoreo(dispositivos: List[DispositivoIoT],
 # ------------------------------------------------------------
 # Punto de entrada del script
 # ------------------------------------------------------------
-if __name__ == "__main__":
-    random.seed(42)
+async def main() -> None:
+    sembrar(42)
 
     # 1) CREACIÓN DE OBJETOS (≥5, de distintos tipos)
     temp1 = SensorTemperatura("TempSensor_01")
@@ -273,10 +449,13 @@ if __name__ == "__main__":
         d.encender()
 
     # 3) EJECUTAR SIMULACIÓN
-    simulacion_monitoreo(
+    await simulacion_monitoreo(
         dispositivos=dispositivos,
         ciclos=5,        # número de iteraciones a ejecutar
         pausa_seg=1.5,   # segundos entre ciclos
         umbral_temp=30.0 # regla: si alguna T > 30°C, luces al 80%
     )
-    
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+# ============================================================
+# Archivo: test_dispositivos_iot.py
+# Pruebas de dispositivos_iot.py (ejecutar con: python -m unittest)
+# ============================================================
+
+import asyncio
+import contextlib
+import io
+import random
+import time
+import unittest
+from unittest import mock
+
+import dispositivos_iot as iot
+
+# Generador aparte (sin sembrar) para las demoras: no debe tocar el de la simulación
+_demoras = random.Random()
+
+
+def _con_demora(lectura):
+    """Envuelve 'lectura' para que tarde un tiempo al azar, como un sensor real."""
+    def lectura_con_demora(self):
+        time.sleep(_demoras.uniform(0, 0.0005))
+        return lectura(self)
+    return lectura_con_demora
+
+
+def _simular_con_semilla(semilla: int) -> str:
+    """Ejecuta una simulación sembrada y devuelve todo lo que imprimió."""
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        iot.sembrar(semilla)
+        dispositivos = ([iot.SensorTemperatura(f"Temp_{i:02d}") for i in range(8)]
+                        + [iot.SensorHumedad(f"Hum_{i:02d}") for i in range(8)]
+                        + [iot.ActuadorLuz("Luz_01")])
+        for d in dispositivos:
+            d.encender()
+        asyncio.run(iot.simulacion_monitoreo(dispositivos, ciclos=20, pausa_seg=0))
+    return salida.getvalue()
+
+
+class TestReproducibilidad(unittest.TestCase):
+
+    def test_misma_semilla_misma_salida(self) -> None:
+        # Las demoras al azar alteran el orden en que terminarían lecturas hechas
+        # en paralelo; si los sorteos dependieran de ese orden, las corridas diferirían.
+        with mock.patch.object(iot.SensorTemperatura, "leer_temperatura",
+                               _con_demora(iot.SensorTemperatura.leer_temperatura)), \
+             mock.patch.object(iot.SensorHumedad, "leer_humedad",
+                               _con_demora(iot.SensorHumedad.leer_humedad)):
+            self.assertEqual(_simular_con_semilla(42), _simular_con_semilla(42))
+
+    def test_semillas_distintas_cambian_lecturas(self) -> None:
+        self.assertNotEqual(_simular_con_semilla(42), _simular_con_semilla(7))
+
+
+if __name__ == "__main__":
+    unittest.main()